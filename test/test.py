@@ -1,10 +1,23 @@
+import logging
+
 import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import ClockCycles, Timer
 
+# (value to load, expected count one cycle after load_n is released)
+LOAD_CASES = tuple((v, (v + 1) & 0xFF) for v in (42, 100, 255, 0, 128))
+
+# rst_n pulse width; shorter than a clock period so the reset check in
+# init_dut only passes if the reset is asynchronous
+RESET_PULSE_NS = 5
+
 
 async def init_dut(dut):
-    """Initialize DUT with clock, reset, and basic setup"""
+    """Initialize DUT with clock, reset, and basic setup.
+
+    All tests share one simulator run, so this is called at the start of each
+    test and brings the DUT back to a known state using only rst_n and inputs.
+    """
     clock = Clock(dut.clk, 1, units="ms")
     cocotb.start_soon(clock.start())
 
@@ -16,14 +29,22 @@ async def init_dut(dut):
     await ClockCycles(dut.clk, 1)
 
     dut.rst_n.value = 0
-    await Timer(5, units="ns")
-    dut.rst_n.value = 1
-    await Timer(5, units="ns")
-    
+    await Timer(RESET_PULSE_NS, units="ns")
+
     # Check that counter is reset to 0 immediately (async reset)
     reset_value = int(dut.uio_out.value)
     assert reset_value == 0, f"Async reset assertion failed: expected 0, got {reset_value}"
 
+    # Released together with the caller's next await
+    dut.rst_n.value = 1
+
+
+async def load_value(dut, value):
+    """Drive load_n low to load value into the counter; the caller releases load_n"""
+    dut.uio_in.value = value
+    dut.ui_in.value = 0b00000000  # Assert load_n=0
+    await ClockCycles(dut.clk, 2)
+
 
 @cocotb.test()
 async def test_counting(dut):
@@ -49,26 +70,33 @@ async def test_counting(dut):
 
     dut.rst_n.value = 1
     await ClockCycles(dut.clk, 2)
-    assert int(dut.uio_out.value) == 1, f"Post-reset counting failed: expected 1, got {int(dut.uio_out.value)}"
+    actual = int(dut.uio_out.value)
+    assert actual == 1, f"Post-reset counting failed: expected 1, got {actual}"
 
     # === Test Overflow Behavior ===
     dut._log.info("Testing overflow behavior")
     
-    await ClockCycles(dut.clk, 253)
-    
-    assert int(dut.uio_out.value) == 254
-    
+    # Load 254 directly instead of counting up to it
+    await load_value(dut, 254)
+
+    actual = int(dut.uio_out.value)
+    assert actual == 254, f"Load failed: expected 254, got {actual}"
+
     # Count to 255
+    dut.ui_in.value = 0b00000001
     await ClockCycles(dut.clk, 1)
-    assert int(dut.uio_out.value) == 255, f"Expected 255, got {int(dut.uio_out.value)}"
+    actual = int(dut.uio_out.value)
+    assert actual == 255, f"Expected 255, got {actual}"
     
     # Test overflow: 255 -> 0
     await ClockCycles(dut.clk, 1)
-    assert int(dut.uio_out.value) == 0, f"Overflow failed: expected 0, got {int(dut.uio_out.value)}"
+    actual = int(dut.uio_out.value)
+    assert actual == 0, f"Overflow failed: expected 0, got {actual}"
     
     # Continue counting after overflow
     await ClockCycles(dut.clk, 1)
-    assert int(dut.uio_out.value) == 1, f"Post-overflow counting failed: expected 1, got {int(dut.uio_out.value)}"
+    actual = int(dut.uio_out.value)
+    assert actual == 1, f"Post-overflow counting failed: expected 1, got {actual}"
 
 
 @cocotb.test()
@@ -76,24 +104,20 @@ async def test_counter_load_values(dut):
     dut._log.info("Testing load")
 
     await init_dut(dut)
+    log_info = dut._log.isEnabledFor(logging.INFO)
 
     # Test loading different values
-    test_values = [42, 100, 255, 0, 128]
-    
-    for test_val in test_values:
-        dut._log.info(f"Testing load of value {test_val}")
-        
-        dut.uio_in.value = test_val
-        
-        dut.ui_in.value = 0b00000000  # Assert load_n=0
-        await ClockCycles(dut.clk, 2)
-        
+    for test_val, expected_next in LOAD_CASES:
+        if log_info:
+            dut._log.info(f"Testing load of value {test_val}")
+
+        await load_value(dut, test_val)
+
         actual = int(dut.uio_out.value)
         assert actual == test_val, f"Load failed: expected {test_val}, got {actual}"
         
         dut.ui_in.value = 0b00000001
         await ClockCycles(dut.clk, 1)
-        expected_next = (test_val + 1) & 0xFF
         actual_next = int(dut.uio_out.value)
         assert actual_next == expected_next, f"Count after load failed: expected {expected_next}, got {actual_next}"
 